@@ -1,9 +1,24 @@
 #!/usr/bin/env python3
 
+import argparse
+import asyncio
+import atexit
+import errno
+import heapq
+import json
+import os
+import queue
+import select
+import shutil
 import subprocess
 import socket
+import struct
 import sys
+import threading
+import time
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 
 try:
     from rich.console import Console
@@ -19,8 +34,24 @@ except ImportError:
     print("Please install the 'rich' library: pip install rich")
     sys.exit(1)
 
+# icmplib is optional; without it we fall back to the system ping binary
+try:
+    from icmplib import ICMPv4Socket, async_ping
+    from icmplib.exceptions import ICMPLibError
+except ImportError:
+    async_ping = None
+
+# aiodns is optional; without it reverse DNS runs across a thread pool
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
 console = Console(force_terminal=True, color_system="256")
 
+# fping can ping a whole list of hosts from one process if it is installed
+FPING = shutil.which("fping")
+
 
 def ping_host(ip: str) -> bool:
     """Ping a host and return True if it responds."""
@@ -35,6 +66,270 @@ def ping_host(ip: str) -> bool:
         return False
 
 
+# ICMP echo header: type, code, checksum, identifier, sequence number
+ICMP_ECHO = struct.Struct("!BBHHH")
+
+# Echo requests sent per wake-up before checking for replies again
+SEND_BURST = 64
+
+# Most probes waiting on a reply at once. On a directly attached subnet
+# every unanswered probe holds an incomplete ARP entry, and the kernel
+# refuses new ones past net.ipv4.neigh.default.gc_thresh3 (1024)
+MAX_IN_FLIGHT = 512
+
+# Pause before retrying a send the kernel had no room for
+SEND_BACKOFF = 0.01
+
+# sendto errors that mean the host itself can't be reached
+UNREACHABLE_ERRORS = (errno.EHOSTUNREACH, errno.ENETUNREACH, errno.EACCES)
+
+# sendto errors that clear up once earlier probes are settled
+RETRYABLE_ERRORS = (errno.ENOBUFS, errno.EAGAIN, errno.ENOMEM)
+
+
+def icmp_checksum(data: bytes) -> int:
+    """Compute the RFC 1071 internet checksum of an ICMP packet."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def ping_hosts(ips: list, timeout: float = 1.0, advance=None) -> set:
+    """Ping every IP from a single shared ICMP socket and return the set that replied.
+
+    Echo requests are sent back to back and replies are matched to their
+    host by sequence number, so the kernel only has one socket to deliver
+    replies to. At most MAX_IN_FLIGHT probes wait on a reply at a time,
+    and a probe that gets none within timeout settles its host as down.
+    Past 65536 hosts, sending also pauses whenever the next sequence
+    number is still held by a probe younger than timeout.
+
+    If the kernel has no room for a probe (a full send buffer, or
+    ENOBUFS once too many ARP lookups are pending), the same host is
+    retried after SEND_BACKOFF. Only an unreachable host or network
+    settles a host as down without a probe; any other send error is
+    retried for up to timeout before giving up on that host.
+
+    Each wake-up from select sends a burst of up to SEND_BURST probes and
+    drains every queued reply, so the syscall count is set by the number
+    of wake-ups rather than one select per packet.
+
+    advance() is called once for every host as it is settled.
+    Raises OSError if an unprivileged ICMP socket cannot be opened.
+    """
+    ident = os.getpid() & 0xFFFF
+    # seq -> (ip, send time) for every probe still waiting on a reply
+    outstanding = {}
+    up = set()
+
+    def expire(seq: int):
+        # The probe holding seq got no reply within timeout; settle it as down
+        del outstanding[seq]
+        if advance:
+            advance()
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP) as sock:
+        sock.setblocking(False)
+        pending = iter(enumerate(ips))
+        next_send = next(pending, None)
+        # No sends before this time after the kernel pushed back
+        resume_at = 0.0
+        # When the current next_send first failed with an unexpected error
+        failing_since = None
+
+        while outstanding or next_send is not None:
+            now = time.monotonic()
+
+            # outstanding is in send order, so the oldest probes come first
+            while outstanding:
+                seq, (_, sent) = next(iter(outstanding.items()))
+                if now - sent < timeout:
+                    break
+                expire(seq)
+
+            wake_at = []
+            if outstanding:
+                wake_at.append(next(iter(outstanding.values()))[1] + timeout)
+
+            # Sequence numbers wrap after 65536 probes; a number can only be
+            # reused once the probe holding it has had its full timeout, which
+            # the expiry above takes care of
+            can_send = (
+                next_send is not None
+                and len(outstanding) < MAX_IN_FLIGHT
+                and (next_send[0] & 0xFFFF) not in outstanding
+            )
+            if can_send and now < resume_at:
+                can_send = False
+                wake_at.append(resume_at)
+
+            # Expiry may have settled the last probes
+            if next_send is None and not outstanding:
+                break
+
+            remaining = max(0, min(wake_at) - now) if wake_at else None
+            readable, writable, _ = select.select([sock], [sock] if can_send else [], [], remaining)
+
+            if writable:
+                for _ in range(SEND_BURST):
+                    index, ip = next_send
+                    seq = index & 0xFFFF
+                    if len(outstanding) >= MAX_IN_FLIGHT or seq in outstanding:
+                        break
+                    header = ICMP_ECHO.pack(8, 0, 0, ident, seq)
+                    packet = ICMP_ECHO.pack(8, 0, icmp_checksum(header), ident, seq)
+                    try:
+                        sock.sendto(packet, (ip, 0))
+                        outstanding[seq] = (ip, time.monotonic())
+                    except OSError as e:
+                        if e.errno in UNREACHABLE_ERRORS:
+                            # No route to the host; count it as down straight away
+                            if advance:
+                                advance()
+                        elif e.errno in RETRYABLE_ERRORS:
+                            # Kernel is out of room; retry this host after a pause
+                            resume_at = time.monotonic() + SEND_BACKOFF
+                            break
+                        else:
+                            if failing_since is None:
+                                failing_since = time.monotonic()
+                            if time.monotonic() - failing_since < timeout:
+                                resume_at = time.monotonic() + SEND_BACKOFF
+                                break
+                            # Kept failing for a whole timeout; give up on this host
+                            if advance:
+                                advance()
+                    failing_since = None
+                    next_send = next(pending, None)
+                    if next_send is None:
+                        break
+
+            if readable:
+                while True:
+                    try:
+                        data, addr = sock.recvfrom(1024)
+                    except BlockingIOError:
+                        break
+                    # macOS hands back the IP header on datagram ICMP sockets
+                    if data and data[0] >> 4 == 4:
+                        data = data[(data[0] & 0x0F) * 4:]
+                    if len(data) < 8:
+                        continue
+                    icmp_type, _, _, _, seq = ICMP_ECHO.unpack_from(data)
+                    held = outstanding.get(seq)
+                    if icmp_type == 0 and held is not None and held[0] == addr[0]:
+                        del outstanding[seq]
+                        up.add(addr[0])
+                        if advance:
+                            advance()
+
+    return up
+
+
+async def async_ping_all(ips: list, advance=None) -> set:
+    """Ping every IP concurrently on a single event loop via icmplib raw sockets.
+    Only useful as root, which may be refused the datagram socket ping_hosts uses.
+    Raises ICMPLibError before pinging anything if a raw socket cannot be opened.
+    """
+    # Fail up front rather than part way through, after progress has moved
+    with ICMPv4Socket(privileged=True):
+        pass
+
+    limit = asyncio.Semaphore(256)
+
+    async def probe(ip: str) -> bool:
+        async with limit:
+            try:
+                is_alive = (await async_ping(ip, count=1, timeout=1, privileged=True)).is_alive
+            except ICMPLibError:
+                # A probe that can't be sent is a host we couldn't reach
+                is_alive = False
+        if advance:
+            advance()
+        return is_alive
+
+    alive = await asyncio.gather(*[probe(ip) for ip in ips])
+    return {ip for ip, is_alive in zip(ips, alive) if is_alive}
+
+
+def fping_hosts(ips: list) -> set:
+    """Ping every IP with a single fping process and return the set that replied.
+    Raises OSError if fping cannot run or fails to send any probes.
+    """
+    # Targets go in on stdin so large scans don't hit the argument length limit
+    result = subprocess.run(
+        [FPING, "-a", "-q", "-r", "0", "-t", "1000"],
+        input="".join(ip + "\n" for ip in ips),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        universal_newlines=True
+    )
+    # 0 = all alive, 1 = some unreachable, 2 = some unknown; anything else is an error
+    if result.returncode > 2:
+        raise OSError(f"fping exited with status {result.returncode}")
+    return set(result.stdout.split())
+
+
+def default_workers(count: int) -> int:
+    """Size a thread pool for count blocking lookups: a small pool for a
+    handful of addresses, growing with the scan up to 256 threads.
+    """
+    return min(count, 256, max(8, count // 4)) or 1
+
+
+def ping_all(ips: list, advance=None, workers: int = None) -> set:
+    """Ping a list of IPs and return the set that responded.
+
+    Uses the shared ICMP socket when the OS allows it, then icmplib on an
+    event loop, then a single fping process, and finally the system ping
+    binary across a thread pool of workers threads (sized from the scan
+    when not given).
+    """
+    try:
+        return ping_hosts(ips, advance=advance)
+    except OSError:
+        pass
+
+    # icmplib's unprivileged socket is the same one ping_hosts just failed to open
+    if async_ping is not None and os.geteuid() == 0:
+        try:
+            return asyncio.run(async_ping_all(ips, advance))
+        except ICMPLibError:
+            pass
+
+    if FPING:
+        try:
+            up = fping_hosts(ips)
+        except OSError:
+            pass
+        else:
+            # fping only reports once every host is done
+            if advance:
+                for _ in ips:
+                    advance()
+            return up
+
+    up = set()
+    with ThreadPoolExecutor(max_workers=workers or default_workers(len(ips))) as executor:
+        future_to_ip = {executor.submit(ping_host, ip): ip for ip in ips}
+        for future in as_completed(future_to_ip):
+            if future.result():
+                up.add(future_to_ip[future])
+            if advance:
+                advance()
+    return up
+
+
+def shorten_hostname(hostname: str) -> str:
+    """Truncate a hostname to fit the 45 character HOSTNAME column."""
+    if len(hostname) > 45:
+        return hostname[:42] + "..."
+    return hostname
+
+
 def load_hosts_file() -> dict:
     """Load /etc/hosts into a dictionary for IP to hostname lookup."""
     hosts = {}
@@ -47,7 +342,7 @@ def load_hosts_file() -> dict:
                     if len(parts) >= 2:
                         ip = parts[0]
                         hostname = parts[1]
-                        hosts[ip] = hostname
+                        hosts[ip] = shorten_hostname(hostname)
     except Exception:
         pass
     return hosts
@@ -56,43 +351,181 @@ def load_hosts_file() -> dict:
 # Load hosts file at startup
 HOSTS_FILE = load_hosts_file()
 
+# Longest we wait on a single reverse DNS lookup; the system resolver
+# would otherwise retry every nameserver for up to 15 seconds
+DNS_TIMEOUT = 1.0
+
+RDNS_CACHE_FILE = os.path.expanduser("~/.cache/scan_network/rdns.json")
+RDNS_CACHE_TTL = 24 * 60 * 60
 
-def get_hostname(ip: str) -> str:
-    """Get hostname for an IP address via reverse DNS or /etc/hosts."""
+
+def load_rdns_cache() -> dict:
+    """Load reverse DNS answers from previous scans that have not expired yet.
+    Entries are stored as {ip: [hostname, timestamp]}.
+    """
+    now = time.time()
+    try:
+        with open(RDNS_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        return {
+            ip: entry for ip, entry in cache.items()
+            if isinstance(entry, list) and len(entry) == 2
+            and isinstance(entry[0], str) and isinstance(entry[1], (int, float))
+            and now - entry[1] < RDNS_CACHE_TTL
+        }
+    except Exception:
+        # Missing, unreadable or malformed cache; start from scratch
+        return {}
+
+
+def save_rdns_cache():
+    """Write the reverse DNS cache back to disk for the next scan."""
+    try:
+        os.makedirs(os.path.dirname(RDNS_CACHE_FILE), exist_ok=True)
+        with open(RDNS_CACHE_FILE, 'w') as f:
+            # Abandoned lookups may still be adding entries, so save a snapshot
+            json.dump(dict(RDNS_CACHE), f)
+    except Exception:
+        pass
+
+
+# Filled from disk by main() when reverse DNS is enabled
+RDNS_CACHE = {}
+
+
+def get_hostname(ip: str, use_dns: bool = True) -> str:
+    """Get hostname for an IP address via /etc/hosts, the cache or reverse DNS."""
     # First check /etc/hosts
     if ip in HOSTS_FILE:
         return HOSTS_FILE[ip]
 
-    # Then try reverse DNS
-    try:
-        hostname = socket.gethostbyaddr(ip)[0]
-        return hostname
-    except socket.herror:
+    if not use_dns:
         return "-"
+
+    # Then answers remembered from earlier scans
+    if ip in RDNS_CACHE:
+        return RDNS_CACHE[ip][0]
+
+    # Then try reverse DNS; only names and definite "unknown host" answers
+    # are cached, since timeouts and other resolver failures may be transient
+    try:
+        hostname = shorten_hostname(socket.gethostbyaddr(ip)[0])
+    except socket.herror as e:
+        if e.errno != 1:  # HOST_NOT_FOUND
+            return "-"
+        hostname = "-"
     except Exception:
         return "-"
 
+    RDNS_CACHE[ip] = [hostname, time.time()]
+    return hostname
 
-def scan_host(ip_info: dict) -> dict:
-    """Scan a single host for status and hostname."""
-    ip = ip_info["ip"]
-    ip_type = ip_info["type"]
 
-    # If it's a network or broadcast address, don't ping it
-    if ip_type in ("NTWRK", "BCAST"):
-        return {
-            "ip": ip,
-            "status": ip_type,
-            "hostname": "-"
-        }
+async def resolve_all(ips: list, advance=None) -> dict:
+    """Resolve PTR records for every IP concurrently on a single thread via aiodns.
+    IPs with no PTR record come back as "-". Lookups that time out or fail for
+    any other reason come back as None, since they may succeed next time.
+    """
+    # c-ares gets longer than the wait_for deadline, so a slow lookup is always
+    # ended by wait_for and never reported as an ordinary resolver error
+    resolver = aiodns.DNSResolver(timeout=DNS_TIMEOUT * 2, tries=1)
+    limit = asyncio.Semaphore(256)
+
+    async def resolve(ip: str) -> str:
+        async with limit:
+            try:
+                answer = await asyncio.wait_for(resolver.gethostbyaddr(ip), DNS_TIMEOUT)
+                hostname = shorten_hostname(answer.name)
+            except aiodns.error.DNSError as e:
+                not_found = e.args and e.args[0] in (aiodns.error.ARES_ENOTFOUND, aiodns.error.ARES_ENODATA)
+                hostname = "-" if not_found else None
+            except Exception:
+                hostname = None
+        if advance:
+            advance()
+        return hostname
 
-    hostname = get_hostname(ip)
-    is_up = ping_host(ip)
-    return {
-        "ip": ip,
-        "status": "UP" if is_up else "DOWN",
-        "hostname": hostname
-    }
+    hostnames = await asyncio.gather(*[resolve(ip) for ip in ips])
+    return dict(zip(ips, hostnames))
+
+
+def resolve_hostnames(ips: list, use_dns: bool = True, advance=None, workers: int = None) -> dict:
+    """Look up the hostname of every IP, resolving cache misses concurrently.
+    Returns a dictionary of IP to hostname.
+    """
+    hostnames = {}
+    misses = []
+    for ip in ips:
+        if ip in HOSTS_FILE or ip in RDNS_CACHE or not use_dns:
+            hostnames[ip] = get_hostname(ip, use_dns)
+            if advance:
+                advance()
+        else:
+            misses.append(ip)
+
+    if not misses:
+        return hostnames
+
+    if aiodns is not None:
+        answers = asyncio.run(resolve_all(misses, advance))
+        now = time.time()
+        for ip, hostname in answers.items():
+            # Only names and definite "no PTR record" answers are cached
+            if hostname is None:
+                hostname = "-"
+            else:
+                RDNS_CACHE[ip] = [hostname, now]
+            hostnames[ip] = hostname
+        return hostnames
+
+    # gethostbyaddr blocks in the system resolver and can't be given a timeout,
+    # so each lookup runs on its own daemon thread. A lookup still running after
+    # DNS_TIMEOUT is shown as "-" and abandoned; being a daemon thread, it can't
+    # keep the process alive after the scan. Abandoned lookups keep their slot
+    # until gethostbyaddr really returns, so no more than workers lookups are
+    # ever in the resolver at once.
+    workers = workers or default_workers(len(misses))
+    slots = threading.BoundedSemaphore(workers)
+    answers = queue.Queue()
+    pending = iter(misses)
+    next_ip = next(pending, None)
+    running = {}
+
+    def lookup(ip: str):
+        try:
+            hostname = get_hostname(ip)
+        finally:
+            # Free the slot before answering, so the main loop can reuse it
+            # as soon as it wakes up
+            slots.release()
+        answers.put((ip, hostname))
+
+    while next_ip is not None or running:
+        while next_ip is not None and slots.acquire(blocking=False):
+            threading.Thread(target=lookup, args=(next_ip,), daemon=True).start()
+            running[next_ip] = time.monotonic() + DNS_TIMEOUT
+            next_ip = next(pending, None)
+
+        # With every slot held by abandoned lookups, wait for one of them to finish
+        wait = max(0, min(running.values()) - time.monotonic()) if running else None
+        try:
+            ip, hostname = answers.get(timeout=wait)
+        except queue.Empty:
+            now = time.monotonic()
+            for ip in [ip for ip, deadline in running.items() if deadline <= now]:
+                del running[ip]
+                hostnames[ip] = "-"
+                if advance:
+                    advance()
+            continue
+
+        # Late answers for lookups that were already given up on are ignored
+        if running.pop(ip, None) is not None:
+            hostnames[ip] = hostname
+            if advance:
+                advance()
+
+    return hostnames
 
 
 def display_banner():
@@ -112,67 +545,56 @@ def display_banner():
 
 def ip_to_int(ip: str) -> int:
     """Convert an IP address string to an integer."""
-    parts = ip.split(".")
-    return (int(parts[0]) << 24) + (int(parts[1]) << 16) + (int(parts[2]) << 8) + int(parts[3])
+    return struct.unpack("!I", socket.inet_aton(ip))[0]
 
 
 def int_to_ip(num: int) -> str:
     """Convert an integer to an IP address string."""
-    return f"{(num >> 24) & 255}.{(num >> 16) & 255}.{(num >> 8) & 255}.{num & 255}"
-
-
-def get_ip_type(ip_int: int, cidr: int) -> str:
-    """Determine if an IP is a network address, broadcast address, or host.
-    Returns 'NTWRK', 'BCAST', or 'HOST'.
-    """
-    block_size = 2 ** (32 - cidr)
-    network = (ip_int // block_size) * block_size
-    broadcast = network + block_size - 1
-
-    # Special cases for /31 and /32
-    if cidr >= 31:
-        return "HOST"
-
-    if ip_int == network:
-        return "NTWRK"
-    elif ip_int == broadcast:
-        return "BCAST"
-    else:
-        return "HOST"
+    return socket.inet_ntoa(struct.pack("!I", num))
 
 
-def generate_ip_list(start_ip: str, num_hosts: int, cidr: int = 24) -> list:
+def generate_ip_list(start_ip: str, num_hosts: int, cidr: int = 24) -> tuple:
     """Generate a list of IP addresses starting from start_ip for num_hosts count.
     Only counts valid HOST addresses toward num_hosts.
-    Network and broadcast addresses are included but not counted.
+    Network and broadcast addresses crossed along the way are returned in a
+    separate list, since they are never scanned: returns (hosts, boundaries).
+    Addresses are kept as integers; convert them with int_to_ip when needed.
     """
     ips = []
-    block_size = 2 ** (32 - cidr)
+    boundaries = []
+    block_size = 1 << (32 - cidr)
+    host_mask = block_size - 1
+
+    # /31 and /32 have no network or broadcast address
+    has_boundaries = cidr < 31
 
     current_ip = ip_to_int(start_ip)
     hosts_found = 0
 
-    while hosts_found < num_hosts:
-        # Check for overflow
-        if current_ip > 0xFFFFFFFF:
-            break
+    # Walk the range a subnet block at a time; only the block edges need
+    # classifying, everything between them is a host
+    while hosts_found < num_hosts and current_ip <= 0xFFFFFFFF:
+        network = current_ip & ~host_mask
+        broadcast = network | host_mask
 
-        ip_type = get_ip_type(current_ip, cidr)
-        ips.append({
-            "ip": int_to_ip(current_ip),
-            "type": ip_type
-        })
+        if has_boundaries and current_ip == network:
+            boundaries.append({"ip_int": current_ip, "type": "NTWRK"})
+            current_ip += 1
 
-        # Only count hosts toward our total
-        if ip_type == "HOST":
-            hosts_found += 1
+        last_host = broadcast - 1 if has_boundaries else broadcast
+        last_host = min(last_host, current_ip + num_hosts - hosts_found - 1)
+        ips.extend({"ip_int": ip_int, "type": "HOST"} for ip_int in range(current_ip, last_host + 1))
+        hosts_found += last_host + 1 - current_ip
+        current_ip = last_host + 1
 
-        current_ip += 1
+        if has_boundaries and current_ip == broadcast and hosts_found < num_hosts:
+            boundaries.append({"ip_int": current_ip, "type": "BCAST"})
+            current_ip += 1
 
-    return ips
+    return ips, boundaries
 
 
-def get_user_input() -> list:
+def get_user_input() -> tuple:
     """Get the IP range from the user."""
     while True:
         console.print("[bright_yellow]Enter the starting IP address (e.g., 10.200.40.1):[/bright_yellow]")
@@ -238,6 +660,16 @@ def get_user_input() -> list:
     return generate_ip_list(start_ip, num_hosts, cidr)
 
 
+# IP address style and pre-built status cell, keyed by result status.
+# The status cells are shared by every row rather than rebuilt per row.
+STATUS_RENDER = {
+    "UP": ("bright_white", Text("● UP", style="bold green")),
+    "DOWN": ("bright_yellow", Text("● DOWN", style="bold red")),
+    "NTWRK": ("bright_cyan", Text("◆ NTWRK", style="bold cyan")),
+    "BCAST": ("bright_magenta", Text("◆ BCAST", style="bold magenta")),
+}
+
+
 def create_results_table(results: list) -> Table:
     """Create a rich table with the scan results."""
     table = Table(
@@ -253,45 +685,32 @@ def create_results_table(results: list) -> Table:
     table.add_column("HOSTNAME", style="bright_white", width=45, justify="left")
 
     for result in results:
-        if result["status"] == "UP":
-            ip_text = Text(result["ip"], style="bright_white")
-            status = Text("● UP", style="bold green")
-        elif result["status"] == "DOWN":
-            ip_text = Text(result["ip"], style="bright_yellow")
-            status = Text("● DOWN", style="bold red")
-        elif result["status"] == "NTWRK":
-            ip_text = Text(result["ip"], style="bright_cyan")
-            status = Text("◆ NTWRK", style="bold cyan")
-        elif result["status"] == "BCAST":
-            ip_text = Text(result["ip"], style="bright_magenta")
-            status = Text("◆ BCAST", style="bold magenta")
-
-        hostname = result["hostname"]
-        if len(hostname) > 45:
-            hostname = hostname[:42] + "..."
-
-        table.add_row(ip_text, status, hostname)
+        ip_style, status = STATUS_RENDER[result["status"]]
+        ip_text = Text(result["ip"], style=ip_style)
+
+        table.add_row(ip_text, status, Text(result["hostname"]))
 
     return table
 
 
+# Summary panel label and style for each status, in display order
+SUMMARY_ROWS = (
+    ("UP", "● Hosts UP:   ", "bright_green"),
+    ("DOWN", "● Hosts DOWN: ", "bright_red"),
+    ("NTWRK", "◆ Network:    ", "bright_cyan"),
+    ("BCAST", "◆ Broadcast:  ", "bright_magenta"),
+)
+
+
 def create_summary_panel(results: list) -> Panel:
     """Create a summary panel."""
-    up_count = sum(1 for r in results if r["status"] == "UP")
-    down_count = sum(1 for r in results if r["status"] == "DOWN")
-    ntwrk_count = sum(1 for r in results if r["status"] == "NTWRK")
-    bcast_count = sum(1 for r in results if r["status"] == "BCAST")
+    counts = Counter(r["status"] for r in results)
     total = len(results)
 
     summary = Text()
-    summary.append("● Hosts UP:   ", style="bright_green")
-    summary.append(f"{up_count}\n", style="bold bright_white")
-    summary.append("● Hosts DOWN: ", style="bright_red")
-    summary.append(f"{down_count}\n", style="bold bright_white")
-    summary.append("◆ Network:    ", style="bright_cyan")
-    summary.append(f"{ntwrk_count}\n", style="bold bright_white")
-    summary.append("◆ Broadcast:  ", style="bright_magenta")
-    summary.append(f"{bcast_count}\n", style="bold bright_white")
+    for status, label, style in SUMMARY_ROWS:
+        summary.append(label, style=style)
+        summary.append(f"{counts[status]}\n", style="bold bright_white")
     summary.append("● Total:      ", style="bright_yellow")
     summary.append(f"{total}", style="bold bright_white")
 
@@ -304,19 +723,60 @@ def create_summary_panel(results: list) -> Panel:
     )
 
 
+def batched_advance(progress: Progress, task_id, total: int):
+    """Return a callback that advances a progress task one step per call.
+    Rich is only updated every 0.5% of total or every 100ms, so large scans
+    don't pay for a progress update on every single host.
+    """
+    step = max(1, total // 200)
+    done = 0
+    shown = 0
+    shown_at = time.monotonic()
+
+    def advance():
+        nonlocal done, shown, shown_at
+        done += 1
+        if done - shown >= step or time.monotonic() - shown_at >= 0.1:
+            progress.update(task_id, completed=done)
+            shown = done
+            shown_at = time.monotonic()
+
+    return advance
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Scan a range of IP addresses for live hosts.")
+    parser.add_argument("--no-dns", action="store_true",
+                        help="skip reverse DNS lookups (hostnames from /etc/hosts are still shown)")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="threads to use when pinging or resolving falls back to a thread pool "
+                             "(default: sized from the number of hosts)")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+
 def main():
+    args = parse_args()
+
+    # Load the reverse DNS cache and save it again on exit
+    if not args.no_dns:
+        RDNS_CACHE.update(load_rdns_cache())
+        atexit.register(save_rdns_cache)
+
     console.clear()
     display_banner()
 
-    ips = get_user_input()
-    total = len(ips)
+    ips, boundaries = get_user_input()
 
-    # Count only actual hosts (not network/broadcast)
-    host_count = sum(1 for ip in ips if ip["type"] == "HOST")
+    # Only hosts are scanned; network/broadcast addresses are listed separately
+    host_count = len(ips)
 
-    # Get first and last IP for display
-    first_ip = ips[0]["ip"]
-    last_ip = ips[-1]["ip"]
+    # Get first and last IP for display, which may be a network address
+    first_ip = int_to_ip(min(ip["ip_int"] for ip in ips[:1] + boundaries[:1]))
+    last_ip = int_to_ip(max(ip["ip_int"] for ip in ips[-1:] + boundaries[-1:]))
 
     console.print()
     console.print(
@@ -327,8 +787,6 @@ def main():
         f"[bright_cyan]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bright_cyan]")
     console.print()
 
-    results = []
-
     # Scan with progress bar and parallel execution
     with Progress(
             SpinnerColumn(spinner_name="dots12", style="bright_yellow"),
@@ -338,19 +796,35 @@ def main():
             TimeElapsedColumn(),
             console=console
     ) as progress:
-        task = progress.add_task("Scanning hosts...", total=total)
-
-        # Use ThreadPoolExecutor for parallel scanning
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            future_to_ip = {executor.submit(scan_host, ip_info): ip_info for ip_info in ips}
-
-            for future in as_completed(future_to_ip):
-                result = future.result()
-                results.append(result)
-                progress.update(task, advance=1)
-
-    # Sort results by IP address
-    results.sort(key=lambda x: [int(p) for p in x["ip"].split(".")])
+        # The ping and DNS phases work on address strings
+        host_ips = [int_to_ip(ip["ip_int"]) for ip in ips]
+        ping_task = progress.add_task("Pinging hosts...", total=len(host_ips))
+        up_hosts = ping_all(host_ips, batched_advance(progress, ping_task, len(host_ips)), args.workers)
+        progress.update(ping_task, completed=len(host_ips))
+
+        # Down hosts usually have nothing but a slow PTR timeout to offer,
+        # so they only get names from /etc/hosts
+        hostnames = {ip: get_hostname(ip, use_dns=False) for ip in host_ips if ip not in up_hosts}
+
+        up_ips = [ip for ip in host_ips if ip in up_hosts]
+        dns_task = progress.add_task("Resolving hostnames...", total=len(up_ips))
+        hostnames.update(resolve_hostnames(up_ips, not args.no_dns, batched_advance(progress, dns_task, len(up_ips)),
+                                            args.workers))
+        progress.update(dns_task, completed=len(up_ips))
+
+    # ips and boundaries are each generated in address order, so building
+    # results from them and merging the two keeps everything sorted
+    # Hosts reuse the address strings from the scan; network and broadcast
+    # addresses are never pinged or resolved, so they are only formatted here
+    host_results = [
+        {"ip": ip, "ip_int": ip_info["ip_int"], "status": "UP" if ip in up_hosts else "DOWN", "hostname": hostnames[ip]}
+        for ip_info, ip in zip(ips, host_ips)
+    ]
+    boundary_results = [
+        {"ip": int_to_ip(ip_info["ip_int"]), "ip_int": ip_info["ip_int"], "status": ip_info["type"], "hostname": "-"}
+        for ip_info in boundaries
+    ]
+    results = list(heapq.merge(host_results, boundary_results, key=itemgetter("ip_int")))
 
     console.print()
 